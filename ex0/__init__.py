@@ -0,0 +1 @@
+"""Exercise 0 - Command Quest (command-line arguments)."""
@@ -1,7 +1,176 @@
+"""
+Command Quest - Command-Line Arguments and Batch Commands.
+
+Demonstrates:
+- Reading command-line arguments from sys.argv
+- Registering command handlers in a dictionary
+- Reading newline- or NUL-delimited commands in large chunks
+- Buffering output into large writes
+
+Batch mode reads one command per line ("name arg1 arg2 ...") and
+writes one output line per command, in input order:
+    python3 ft_command_quest.py --stdin [-0] < commands.txt
+    python3 ft_command_quest.py --file commands.txt [-0]
+"""
+
 import sys
 
+HANDLERS = {}
+
+
+def register(name):
+    """Register the decorated function as the handler of command `name`."""
+    def decorate(handler):
+        HANDLERS[name] = handler
+        return handler
+    return decorate
+
+
+@register("echo")
+def handle_echo(args):
+    """Return the arguments separated by spaces."""
+    return " ".join(args)
+
+
+@register("count")
+def handle_count(args):
+    """Return the number of arguments."""
+    return str(len(args))
+
+
+@register("sum")
+def handle_sum(args):
+    """Return the sum of the integer arguments."""
+    return str(sum(int(arg) for arg in args))
+
+
+def read_commands(stream, delimiter=b"\n", chunk_size=1 << 20):
+    """
+    Read delimited commands from a binary stream in large chunks.
+
+    Args:
+        stream: Binary file object
+        delimiter: b"\\n" or b"\\0"
+        chunk_size: Number of bytes read at once
+
+    Yields:
+        str: One command
+    """
+    separator = delimiter.decode()
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if pending:
+            chunk = pending + chunk
+        cut = chunk.rfind(delimiter)
+        if cut < 0:
+            pending = chunk
+            continue
+        pending = chunk[cut + 1:]
+        # The delimiter is ASCII, so a cut never splits a UTF-8 sequence
+        yield from chunk[:cut].decode(errors="replace").split(separator)
+    if pending:
+        yield pending.decode(errors="replace")
+
+
+def dispatch_commands(commands, output, buffer_size=1 << 16):
+    """
+    Run every command through its handler and write the results.
+
+    Every non-empty input command produces exactly one output line, so
+    output lines stay aligned with the input: unknown commands and
+    exceptions raised by a handler produce an error line, blank commands
+    and handlers returning None produce an empty line, and other return
+    values are converted with str().
+
+    Args:
+        commands: Iterable of command strings
+        output: Binary file object receiving the output lines
+        buffer_size: Number of characters collected before each write
+
+    Returns:
+        tuple: (commands processed, commands failed)
+    """
+    handlers = HANDLERS
+    buffer = []
+    buffered = 0
+    processed = 0
+    failed = 0
+    for command in commands:
+        parts = command.split()
+        if not parts:
+            line = ""
+        else:
+            processed += 1
+            handler = handlers.get(parts[0])
+            if handler is None:
+                line = f"Error: unknown command '{parts[0]}'"
+                failed += 1
+            else:
+                try:
+                    line = handler(parts[1:])
+                    line = "" if line is None else str(line)
+                except Exception as e:
+                    # One failing command must not abort a long batch run
+                    line = f"Error: {parts[0]}: {type(e).__name__}: {e}"
+                    failed += 1
+        buffer.append(line)
+        buffered += len(line) + 1
+        if buffered >= buffer_size:
+            buffer.append("")
+            output.write("\n".join(buffer).encode())
+            buffer = []
+            buffered = 0
+    if buffer:
+        buffer.append("")
+        output.write("\n".join(buffer).encode())
+    return processed, failed
+
+
+def run_batch(arguments):
+    """
+    Run batch mode.
+
+    Args:
+        arguments: Command-line arguments starting with --stdin or --file
+
+    Returns:
+        int: Exit status (1 if any command failed)
+    """
+    delimiter = b"\0" if "-0" in arguments or "--null" in arguments else b"\n"
+    sys.stdout.flush()
+    output = sys.stdout.buffer
+    if arguments[0] == "--file":
+        if len(arguments) < 2:
+            print("Usage: python3 ft_command_quest.py --file PATH [-0]",
+                  file=sys.stderr)
+            return 2
+        try:
+            source = open(arguments[1], "rb")
+        except OSError as e:
+            print(f"❌ Cannot read '{arguments[1]}': {e.strerror}",
+                  file=sys.stderr)
+            return 2
+        with source:
+            processed, failed = dispatch_commands(
+                read_commands(source, delimiter), output
+            )
+    else:
+        processed, failed = dispatch_commands(
+            read_commands(sys.stdin.buffer, delimiter), output
+        )
+    output.flush()
+    print(f"Commands processed: {processed} (failed: {failed})",
+          file=sys.stderr)
+    return 1 if failed else 0
+
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ("--stdin", "--file"):
+        return run_batch(sys.argv[1:])
+
     print("=== Command Quest ===")
 
     program_name = sys.argv[0]
@@ -25,4 +194,5 @@ def main():
     print(f"Total arguments: {total}")
 
 
-main()
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Exercise 1 - Score Analytics (lists)."""
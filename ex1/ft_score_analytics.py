@@ -1,53 +1,108 @@
+"""
+PixelMetrics 3000 - Score Cruncher.
+
+Demonstrates:
+- Parsing command-line arguments into a list of scores
+- Skipping invalid input with error handling
+- Calculating statistics with built-in functions
+- Splitting scores with list comprehensions
+"""
+
 import sys
 
-argumente = sys.argv[1:]
-
-print("=== PixelMetrics 3000 - Score Cruncher ===\n")
-
-if len(argumente) == 0:
-    print("❌ No scores entered!")
-    print("💡 Use:  python3 schritt4_stats.py 100 200 300")
-    sys.exit()
-
-scores = []
-for arg in argumente:
-    try:
-        if int(arg) < 0:
-            print(f"⚠️  '{arg}' ignoring (negative number)")
-            continue
-        if arg[1:].isdigit() and arg[0] == '0':
-            print(f"⚠️  '{arg}' invalid number")
-            continue
-        zahl = int(arg)
-        scores.append(zahl)
-    except ValueError:
-        print(f"⚠️  '{arg}' ignored (not a number)")
-
-# Check if valid scores are present
-if len(scores) == 0:
-    print("❌ No valid scores found!")
-    sys.exit()
-
-# Calculate statistics
-count = len(scores)
-highest_score = max(scores)
-lowest_score = min(scores)
-total_sum = sum(scores)
-average = total_sum / count
-low_scores = [s for s in scores if s < average]
-high_scores = [s for s in scores if s >= average]
-score_range = highest_score - lowest_score
-
-# Output results
-print("\n📊 STATISTICS")
-print("=" * 40)
-print(f"Number of Scores:       {count}")
-print(f"Highest Score:     {highest_score} 🏆")
-print(f"Lowest Score:  {lowest_score}")
-print(f"Total Sum:        {total_sum}")
-print(f"Average:       {average:.2f}")
-print(f"Score Range:        {score_range}")
-print(f"Low Scores: {len(low_scores)}")
-print(f"High Scores: {len(high_scores)}")
-print("=" * 40)
-print("\n✅ Analysis complete. Good luck next time!")
+
+def parse_scores(args):
+    """
+    Parse command-line arguments into a list of scores.
+
+    Args:
+        args: Score strings
+
+    Returns:
+        tuple: (valid scores, warning messages for ignored arguments)
+    """
+    scores = []
+    warnings = []
+    for arg in args:
+        try:
+            if int(arg) < 0:
+                warnings.append(f"⚠️  '{arg}' ignoring (negative number)")
+                continue
+            if arg[1:].isdigit() and arg[0] == '0':
+                warnings.append(f"⚠️  '{arg}' invalid number")
+                continue
+            zahl = int(arg)
+            scores.append(zahl)
+        except ValueError:
+            warnings.append(f"⚠️  '{arg}' ignored (not a number)")
+    return scores, warnings
+
+
+def calculate_statistics(scores):
+    """
+    Calculate statistics of a non-empty list of scores.
+
+    Args:
+        scores: List of scores
+
+    Returns:
+        dict: Count, extremes, sum, average, range and score split
+    """
+    count = len(scores)
+    highest_score = max(scores)
+    lowest_score = min(scores)
+    total_sum = sum(scores)
+    average = total_sum / count
+    low_scores = [s for s in scores if s < average]
+    high_scores = [s for s in scores if s >= average]
+    return {
+        "count": count,
+        "highest": highest_score,
+        "lowest": lowest_score,
+        "total": total_sum,
+        "average": average,
+        "range": highest_score - lowest_score,
+        "low_scores": low_scores,
+        "high_scores": high_scores,
+    }
+
+
+def main():
+    """Run the score cruncher."""
+    argumente = sys.argv[1:]
+
+    print("=== PixelMetrics 3000 - Score Cruncher ===\n")
+
+    if len(argumente) == 0:
+        print("❌ No scores entered!")
+        print("💡 Use:  python3 schritt4_stats.py 100 200 300")
+        return
+
+    scores, warnings = parse_scores(argumente)
+    for warning in warnings:
+        print(warning)
+
+    # Check if valid scores are present
+    if len(scores) == 0:
+        print("❌ No valid scores found!")
+        return
+
+    stats = calculate_statistics(scores)
+
+    # Output results
+    print("\n📊 STATISTICS")
+    print("=" * 40)
+    print(f"Number of Scores:       {stats['count']}")
+    print(f"Highest Score:     {stats['highest']} 🏆")
+    print(f"Lowest Score:  {stats['lowest']}")
+    print(f"Total Sum:        {stats['total']}")
+    print(f"Average:       {stats['average']:.2f}")
+    print(f"Score Range:        {stats['range']}")
+    print(f"Low Scores: {len(stats['low_scores'])}")
+    print(f"High Scores: {len(stats['high_scores'])}")
+    print("=" * 40)
+    print("\n✅ Analysis complete. Good luck next time!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Exercise 2 - 3D Coordinate System (tuples)."""
@@ -11,6 +11,10 @@ Demonstrates:
 
 import math
 
+# Result of the NumPy import: unset until the first load_numpy() call,
+# then the module or None if NumPy is not installed
+_numpy = False
+
 
 def calculate_distance(point1, point2):
     """Calculate Euclidean distance between two 3D points."""
@@ -20,6 +24,40 @@ def calculate_distance(point1, point2):
     return distance
 
 
+def load_numpy():
+    """Import NumPy on first use; return None if it is not installed."""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def calculate_distances(origin, points):
+    """
+    Calculate Euclidean distances from one 3D point to many.
+
+    NumPy is used when installed; it is imported on the first call so
+    that importing this module stays cheap. Both paths raise ValueError
+    for points that do not have exactly three coordinates.
+    """
+    numpy = load_numpy()
+    if numpy is None:
+        return [calculate_distance(origin, point) for point in points]
+    if not len(points):
+        return []
+    coords = numpy.asarray(points, dtype=float)
+    if coords.ndim != 2 or coords.shape[1] != 3:
+        raise ValueError(
+            f"expected points with 3 coordinates, got shape {coords.shape}"
+        )
+    offsets = coords - numpy.asarray(origin, dtype=float)
+    return numpy.sqrt((offsets * offsets).sum(axis=1)).tolist()
+
+
 def parse_coordinates(coord_str):
     """Parse a string of the form 'x,y,z' into a tuple of floats."""
     parts = coord_str.split(",")
@@ -61,4 +99,5 @@ def main():
     print(f"Coordinates; x={x}, y={y}, z={z}")
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Exercise 3 - Achievement Tracker (sets)."""
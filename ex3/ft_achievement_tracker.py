@@ -33,7 +33,7 @@ def get_common_achievements(players_dict):
     common_achievements = achievement_sets[0]
     for achievements in achievement_sets[1:]:
         common_achievements = common_achievements.intersection(achievements)
-        return common_achievements
+    return common_achievements
 
 
 def get_rare_achievements(players_dict):
@@ -99,4 +99,5 @@ def main():
     print("\n✅ Achievement tracking completed.")
 
 
-main()
+if __name__ == "__main__":
+    main()
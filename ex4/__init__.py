@@ -0,0 +1 @@
+"""Exercise 4 - Inventory System (dictionaries)."""
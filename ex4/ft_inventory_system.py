@@ -19,7 +19,7 @@ def parse_inventory(args):
         if ":" in arg:
             item, quantity = arg.split(":", 1)
             inventory[item] = int(quantity)
-        return inventory
+    return inventory
 
 
 def calculate_total_items(inventory):
@@ -141,4 +141,5 @@ def main():
     print(f"Sample lookup - 'sword' in inventory: {'sword' in inventory}")
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Exercise 5 - Data Stream Processor (generators)."""
@@ -0,0 +1,276 @@
+"""
+Binary Event Log - Archiving and Replaying Game Events.
+
+Demonstrates:
+- Packing events into fixed-width binary records with struct
+- Appending records to a log file in large batches
+- Memory-mapping the log for replay with mmap
+- Zero-copy column access through strided memoryview slices
+- Counting replayed events without creating Python objects per event
+
+Record layout (8 bytes, little-endian):
+    uint32 id | uint8 level | uint8 player code | uint8 action code | pad
+
+Player and action codes are indices into PLAYERS and ACTIONS of
+ft_data_stream.
+
+Usage (from the repository root):
+    python3 -m ex5.ft_event_log [log_file [event_count]]
+"""
+
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+
+from ex5.ft_data_stream import (
+    ACTIONS,
+    PLAYERS,
+    count_action_events,
+    count_high_level_players,
+    game_event_generator,
+)
+
+RECORD = struct.Struct("<IBBBx")
+
+# Byte offsets of the single-byte fields inside a record
+LEVEL_OFFSET = 4
+PLAYER_OFFSET = 5
+ACTION_OFFSET = 6
+
+# Maps every level byte to 1 if it is a high level (10+), else to 0
+HIGH_LEVEL_TABLE = bytes(1 if level >= 10 else 0 for level in range(256))
+
+
+def write_events(path, event_stream, batch_size=65536):
+    """
+    Append game events to a binary event log.
+
+    Args:
+        path: Log file to append to (created if missing)
+        event_stream: Generator of game events
+        batch_size: Number of records packed before each write
+
+    Returns:
+        int: Number of records written
+    """
+    player_codes = {player: code for code, player in enumerate(PLAYERS)}
+    action_codes = {action: code for code, action in enumerate(ACTIONS)}
+    record_size = RECORD.size
+    pack_into = RECORD.pack_into
+
+    batch = bytearray(batch_size * record_size)
+    written = 0
+    pending = 0
+    with open(path, "ab") as file:
+        for event in event_stream:
+            pack_into(
+                batch,
+                pending * record_size,
+                event["id"],
+                event["level"],
+                player_codes[event["player"]],
+                action_codes[event["action"]],
+            )
+            pending += 1
+            if pending == batch_size:
+                file.write(batch)
+                written += pending
+                pending = 0
+        if pending:
+            file.write(memoryview(batch)[:pending * record_size])
+            written += pending
+    return written
+
+
+def read_event_columns(path, chunk_size=1 << 20):
+    """
+    Memory-map an event log and yield its records column by column.
+
+    Every column is a memoryview into the mapped file, so no data is
+    copied and no per-event objects are created. The views are released
+    when the next chunk is produced. Slices and memoryviews taken from a
+    column are views into the mapping too: copy any data that must
+    outlive the iteration step with bytes() or tobytes().
+
+    Args:
+        path: Log file written by write_events
+        chunk_size: Number of records per yielded chunk
+
+    Yields:
+        tuple: (ids, levels, players, actions) columns of one chunk
+
+    Raises:
+        BufferError: If a view derived from a column is still referenced
+        when the log has been read to the end
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < RECORD.size:
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        exhausted = False
+        try:
+            usable = len(view) - len(view) % RECORD.size
+            step = chunk_size * RECORD.size
+            for start in range(0, usable, step):
+                chunk = view[start:min(start + step, usable)]
+                columns = (
+                    _id_column(chunk),
+                    chunk[LEVEL_OFFSET::RECORD.size],
+                    chunk[PLAYER_OFFSET::RECORD.size],
+                    chunk[ACTION_OFFSET::RECORD.size],
+                )
+                try:
+                    yield columns
+                finally:
+                    for column in columns:
+                        if isinstance(column, memoryview):
+                            column.release()
+                    chunk.release()
+            exhausted = True
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # When the consumer stopped early or raised, leave the
+                # mapping to the garbage collector instead of hiding the
+                # real error behind this one
+                if exhausted:
+                    raise BufferError(
+                        f"a view into event log '{path}' is still "
+                        "referenced; copy column data with bytes() or "
+                        "tobytes() instead of keeping slices"
+                    ) from None
+
+
+def _id_column(chunk):
+    """Return the id column of a chunk, zero-copy on little-endian hosts."""
+    words = chunk.cast("I")
+    if sys.byteorder == "little":
+        return words[::2]
+    ids = array("I", words[::2])
+    words.release()
+    ids.byteswap()
+    return ids
+
+
+def replay_events(path):
+    """
+    Replay an event log as event dicts.
+
+    This is the compatibility path for the dict-based counting
+    functions; use the column counters for bulk replays.
+
+    Args:
+        path: Log file written by write_events
+
+    Yields:
+        dict: Event with id, player, level, and action
+    """
+    for ids, levels, players, actions in read_event_columns(path):
+        for event_id, level, player, action in zip(
+            ids, levels, players, actions
+        ):
+            yield {
+                "id": event_id,
+                "player": PLAYERS[player],
+                "level": level,
+                "action": ACTIONS[action],
+            }
+
+
+def count_high_level_records(levels):
+    """
+    Count high-level (10+) entries in a level column.
+
+    Args:
+        levels: Level column yielded by read_event_columns
+
+    Returns:
+        int: Count of high-level player events
+    """
+    return levels.tobytes().translate(HIGH_LEVEL_TABLE).count(1)
+
+
+def count_action_records(actions, action):
+    """
+    Count entries of a specific action type in an action column.
+
+    Args:
+        actions: Action column yielded by read_event_columns
+        action: Action string to count
+
+    Returns:
+        int: Count of matching events
+    """
+    return actions.tobytes().count(ACTIONS.index(action))
+
+
+def replay_counts(path):
+    """
+    Compute the stream analytics of an event log in a single pass.
+
+    Args:
+        path: Log file written by write_events
+
+    Returns:
+        dict: Total, high-level, treasure, and level-up event counts
+    """
+    counts = {"total": 0, "high_level": 0, "treasure": 0, "level_up": 0}
+    for _, levels, _, actions in read_event_columns(path):
+        counts["total"] += len(levels)
+        counts["high_level"] += count_high_level_records(levels)
+        counts["treasure"] += count_action_records(actions, "found treasure")
+        counts["level_up"] += count_action_records(actions, "leveled up")
+    return counts
+
+
+def main(argv=None):
+    """Archive a seeded event stream and replay it from disk."""
+    import tempfile
+
+    args = sys.argv[1:] if argv is None else argv
+    event_count = int(args[1]) if len(args) > 1 else 1000
+
+    print("=== Binary Event Log ===")
+    if args:
+        path = args[0]
+    else:
+        handle, path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+        os.remove(path)
+
+    try:
+        # Start from an empty log; write_events appends to existing files
+        open(path, "wb").close()
+        random.seed(42)
+        written = write_events(path, game_event_generator(event_count))
+        size = os.path.getsize(path)
+        print(f"Archived {written} events to {path} ({size} bytes)")
+
+        counts = replay_counts(path)
+        print()
+        print("=== Replay Analytics ===")
+        print(f"Total events replayed: {counts['total']}")
+        print(f"High-level players (10+): {counts['high_level']}")
+        print(f"Treasure events:  {counts['treasure']}")
+        print(f"Level-up events: {counts['level_up']}")
+
+        # The dict-based counters see the same events as the live stream
+        replayed = count_high_level_players(replay_events(path))
+        random.seed(42)
+        live = count_high_level_players(game_event_generator(event_count))
+        print(f"Dict replay matches live stream: {replayed == live}")
+        treasure = count_action_events(replay_events(path), "found treasure")
+        print(f"Dict replay treasure events: {treasure}")
+    finally:
+        if not args:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
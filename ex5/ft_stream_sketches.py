@@ -0,0 +1,360 @@
+"""
+Stream Sketches - Approximate Event Analytics in Fixed Memory.
+
+Demonstrates:
+- HyperLogLog distinct counting with a configurable error bound
+- Count-Min sketch frequency estimation
+- Space-Saving heavy-hitter tracking
+- Merging sketches built on different workers
+- Deterministic hashing with hashlib (hash() is salted per process)
+
+Usage (from the repository root):
+    python3 -m ex5.ft_stream_sketches
+"""
+
+import hashlib
+import heapq
+import math
+import random
+from array import array
+
+from ex5.ft_data_stream import game_event_generator
+
+
+def hash64(item):
+    """Return a stable 64-bit hash of an item, equal on every worker."""
+    digest = hashlib.blake2b(str(item).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def hash128(item):
+    """Return two stable 64-bit hashes of an item."""
+    digest = hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+    return (
+        int.from_bytes(digest[:8], "little"),
+        int.from_bytes(digest[8:], "little") | 1,
+    )
+
+
+class HyperLogLog:
+    """
+    Distinct counter using 2^precision one-byte registers.
+
+    Args:
+        error: Target relative standard error (0.01 -> 16 KiB)
+
+    Raises:
+        ValueError: If the error needs more than 2^18 registers
+    """
+
+    MAX_PRECISION = 18
+
+    def __init__(self, error=0.01):
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        precision = math.ceil(math.log2((1.04 / error) ** 2))
+        if precision > self.MAX_PRECISION:
+            smallest = 1.04 / math.sqrt(1 << self.MAX_PRECISION)
+            raise ValueError(
+                f"error {error} needs 2^{precision} registers; the "
+                f"smallest supported error is {smallest:.5f}"
+            )
+        # Errors above 0.26 would need fewer than 16 registers
+        self.precision = max(precision, 4)
+        self.registers = bytearray(1 << self.precision)
+
+    def add(self, item):
+        """Add an item to the sketch."""
+        value = hash64(item)
+        index = value >> (64 - self.precision)
+        rest_bits = 64 - self.precision
+        rest = value & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        """Return the estimated number of distinct items."""
+        size = len(self.registers)
+        if size == 16:
+            alpha = 0.673
+        elif size == 32:
+            alpha = 0.697
+        elif size == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(
+            2.0 ** -rank for rank in self.registers
+        )
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    def merge(self, other):
+        """Merge another HyperLogLog with the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+
+class CountMinSketch:
+    """
+    Frequency estimator that never underestimates.
+
+    Estimates exceed the true count by at most epsilon * total with
+    probability 1 - delta.
+
+    Args:
+        epsilon: Error bound relative to the total count
+        delta: Probability of exceeding the error bound
+    """
+
+    def __init__(self, epsilon=0.001, delta=0.01):
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.rows = [array("Q", [0]) * self.width for _ in range(self.depth)]
+        self.total = 0
+
+    def _indexes(self, item):
+        """Return the column of the item in every row (double hashing)."""
+        first, second = hash128(item)
+        width = self.width
+        return [(first + row * second) % width for row in range(self.depth)]
+
+    def add(self, item, count=1):
+        """Add `count` occurrences of an item."""
+        for row, index in zip(self.rows, self._indexes(item)):
+            row[index] += count
+        self.total += count
+
+    def estimate(self, item):
+        """Return the estimated number of occurrences of an item."""
+        return min(
+            row[index] for row, index in zip(self.rows, self._indexes(item))
+        )
+
+    def merge(self, other):
+        """Merge another sketch with the same dimensions into this one."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("cannot merge sketches of different dimensions")
+        for row, other_row in zip(self.rows, other.rows):
+            for index, value in enumerate(other_row):
+                if value:
+                    row[index] += value
+        self.total += other.total
+
+
+class SpaceSaving:
+    """
+    Heavy-hitter tracker keeping at most `capacity` counters.
+
+    Every item occurring more than total / capacity times is tracked.
+    Counts overestimate by at most the recorded error of the item.
+
+    Args:
+        epsilon: Error bound relative to the total count
+        capacity: Number of counters (defaults to ceil(1 / epsilon))
+
+    Raises:
+        ValueError: If epsilon or capacity is out of range
+    """
+
+    def __init__(self, epsilon=0.01, capacity=None):
+        if capacity is None:
+            if not 0 < epsilon < 1:
+                raise ValueError("epsilon must be between 0 and 1")
+            capacity = math.ceil(1 / epsilon)
+        elif capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        # Min-heap of (count, sequence, item); entries whose count no
+        # longer matches self.counts are stale and skipped lazily.
+        self._heap = []
+        self._sequence = 0
+
+    def _push(self, item):
+        """Record the current count of an item in the heap."""
+        self._sequence += 1
+        heapq.heappush(self._heap, (self.counts[item], self._sequence, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        """Drop stale heap entries."""
+        self._heap = [
+            (count, sequence, item)
+            for sequence, (item, count) in enumerate(self.counts.items())
+        ]
+        heapq.heapify(self._heap)
+        self._sequence = len(self._heap)
+
+    def _pop_minimum(self):
+        """Remove and return the item with the smallest count."""
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def add(self, item, count=1):
+        """Add `count` occurrences of an item."""
+        counts = self.counts
+        self.total += count
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+        else:
+            victim, floor = self._pop_minimum()
+            del counts[victim]
+            del self.errors[victim]
+            counts[item] = floor + count
+            self.errors[item] = floor
+        self._push(item)
+
+    def top(self, k=None):
+        """
+        Return the heaviest tracked items.
+
+        Args:
+            k: Number of items to return (all tracked items if None)
+
+        Returns:
+            list: (item, count, error) tuples, heaviest first
+        """
+        ranked = sorted(self.counts.items(), key=lambda x: (-x[1], str(x[0])))
+        return [(item, count, self.errors[item]) for item, count in ranked[:k]]
+
+    def merge(self, other):
+        """Merge another Space-Saving summary into this one."""
+        own_floor = self._floor()
+        other_floor = other._floor()
+        counts = {}
+        errors = {}
+        for item in self.counts.keys() | other.counts.keys():
+            counts[item] = (self.counts.get(item, own_floor)
+                            + other.counts.get(item, other_floor))
+            errors[item] = (self.errors.get(item, own_floor)
+                            + other.errors.get(item, other_floor))
+        kept = sorted(counts, key=lambda x: (-counts[x], str(x)))
+        kept = kept[:self.capacity]
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+        self.total += other.total
+        self._rebuild_heap()
+
+    def _floor(self):
+        """Return the largest count an untracked item may have."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+
+def sketch_events(event_stream, error=0.01, epsilon=0.001, delta=0.01):
+    """
+    Build all event sketches in a single pass.
+
+    Args:
+        event_stream: Generator of game events
+        error: Relative error of the distinct player count
+        epsilon: Error bound of the frequency and heavy-hitter sketches
+        delta: Failure probability of the Count-Min sketch
+
+    Returns:
+        dict: Sketches keyed by what they track
+    """
+    sketches = {
+        "distinct_players": HyperLogLog(error),
+        "player_frequencies": CountMinSketch(epsilon, delta),
+        "top_players": SpaceSaving(epsilon),
+        "top_actions": SpaceSaving(epsilon),
+    }
+    distinct_players = sketches["distinct_players"].add
+    player_frequencies = sketches["player_frequencies"].add
+    top_players = sketches["top_players"].add
+    top_actions = sketches["top_actions"].add
+    for event in event_stream:
+        player = event["player"]
+        distinct_players(player)
+        player_frequencies(player)
+        top_players(player)
+        top_actions(event["action"])
+    return sketches
+
+
+def merge_sketches(target, other):
+    """
+    Merge the sketches of another worker into `target`.
+
+    Args:
+        target: Result of sketch_events, updated in place
+        other: Result of sketch_events built with the same parameters
+
+    Returns:
+        dict: The updated target
+    """
+    for name, sketch in target.items():
+        sketch.merge(other[name])
+    return target
+
+
+def wide_event_generator(count, player_count):
+    """
+    Generate game events from a large player population.
+
+    Args:
+        count: Number of events to generate
+        player_count: Number of distinct player ids to draw from
+
+    Yields:
+        dict: Event with player, level, and action
+    """
+    for event in game_event_generator(count):
+        event["player"] = f"player_{random.randrange(player_count)}"
+        yield event
+
+
+def main():
+    """Run the stream sketch demonstration."""
+    random.seed(42)
+
+    print("=== Stream Sketches ===")
+    event_count = 50000
+    sketches = sketch_events(game_event_generator(event_count))
+    print(f"Events sketched: {event_count}")
+    print(f"Distinct players (HLL): {sketches['distinct_players'].count()}")
+    frequencies = sketches["player_frequencies"]
+    print(f"Events by alice (Count-Min): {frequencies.estimate('alice')}")
+    top_actions = sketches["top_actions"].top(3)
+    actions_str = ", ".join(f"{a} ({c})" for a, c, _ in top_actions)
+    print(f"Top actions: {actions_str}")
+
+    # Two workers sketch half of a large population each
+    print()
+    print("=== Merged Worker Sketches ===")
+    random.seed(42)
+    worker_a = sketch_events(wide_event_generator(event_count, 20000))
+    worker_b = sketch_events(wide_event_generator(event_count, 20000))
+    merged = merge_sketches(worker_a, worker_b)
+    random.seed(42)
+    exact = {e["player"] for e in wide_event_generator(event_count, 20000)}
+    exact |= {e["player"] for e in wide_event_generator(event_count, 20000)}
+    print(f"Distinct players (exact): {len(exact)}")
+    print(f"Distinct players (HLL): {merged['distinct_players'].count()}")
+    registers = len(merged["distinct_players"].registers)
+    print(f"HyperLogLog memory: {registers} bytes")
+    top_player, top_count, top_error = merged["top_players"].top(1)[0]
+    print(f"Top player: {top_player} ({top_count} events, "
+          f"error <= {top_error})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Exercise 6 - Analytics Dashboard (comprehensions)."""
@@ -0,0 +1,166 @@
+"""
+Parallel Analytics Dashboard - Partitioned Aggregation.
+
+Demonstrates:
+- Partitioning chunked player files across a process pool
+- Aggregating every partition into a mergeable partial state
+- Folding partial states in partition order as they arrive
+- Producing results identical to the serial streaming pass
+
+Usage (from the repository root):
+    python3 -m ex6.ft_dashboard_parallel [dataset_directory [workers]]
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ex6.ft_analytics_dashboard import combined_analysis, create_sample_data
+from ex6.ft_dashboard_stream import (
+    aggregate_records,
+    dataset_paths,
+    finalize_state,
+    iter_records,
+    merge_into,
+    print_dashboard,
+    records_from_data,
+    streaming_dashboard,
+    write_dataset,
+)
+
+
+def aggregate_paths(paths, sample_limit=100):
+    """Aggregate the records of some chunk files (runs in a worker)."""
+    return aggregate_records(iter_records(paths), sample_limit)
+
+
+def pool_size(workers, partitions):
+    """Return the number of worker processes worth starting."""
+    return max(1, min(workers or os.cpu_count() or 1, partitions))
+
+
+def parallel_dashboard(source, workers=None, sample_limit=100):
+    """
+    Compute the dashboard of an on-disk dataset with a process pool.
+
+    Every chunk file is one partition, read by the worker aggregating
+    it, so only the small partial states cross process boundaries.
+    In-memory data is deliberately not partitioned here: pickling the
+    players into the workers costs more than aggregating them serially,
+    so write it with write_dataset first.
+
+    Telemetry recorded inside the workers (e.g. for aggregate_records)
+    stays in their processes and is not part of the parent's registry.
+
+    Args:
+        source: Directory of *.jsonl chunks, a single file, or a list
+        workers: Maximum number of worker processes (defaults to CPU
+            count, never more than the number of chunk files)
+        sample_limit: Number of high scorer names to keep
+
+    Returns:
+        dict: Dashboard sections, identical to streaming_dashboard
+    """
+    partitions = [[path] for path in dataset_paths(source)]
+    if not partitions:
+        return finalize_state(aggregate_records([], sample_limit))
+    workers = pool_size(workers, len(partitions))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        states = executor.map(
+            aggregate_paths, partitions, [sample_limit] * len(partitions)
+        )
+        # Every state is a fresh copy from a worker, so the first one
+        # can accumulate the others in place
+        total = next(states)
+        for state in states:
+            merge_into(total, state)
+        return finalize_state(total)
+
+
+def synthetic_records(count, seed=42):
+    """
+    Generate random player records for load testing.
+
+    Args:
+        count: Number of players
+        seed: Random seed
+
+    Yields:
+        dict: Player record
+    """
+    rng = random.Random(seed)
+    regions = ["north", "east", "south", "west", "central"]
+    pool = [f"achievement_{i}" for i in range(50)]
+    for i in range(count):
+        yield {
+            "name": f"player_{i}",
+            "score": rng.randint(0, 3000),
+            "level": rng.randint(1, 20),
+            "active": rng.random() < 0.75,
+            "region": rng.choice(regions),
+            "achievements": rng.sample(pool, rng.randint(0, 10)),
+        }
+
+
+def compare_runs(source, workers):
+    """Time the serial and parallel dashboards and check they agree."""
+    start = time.perf_counter()
+    serial = streaming_dashboard(source, sample_limit=10)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = parallel_dashboard(source, workers, sample_limit=10)
+    parallel_time = time.perf_counter() - start
+
+    print_dashboard(parallel)
+    print()
+    print(f"Serial time: {serial_time:.3f} seconds")
+    workers = pool_size(workers, len(dataset_paths(source)))
+    print(f"Parallel time: {parallel_time:.3f} seconds "
+          f"({workers} workers)")
+    print(f"Speedup: {serial_time / parallel_time:.2f}x")
+    print(f"Identical to serial output: {parallel == serial}")
+
+
+def main():
+    """Run the parallel analytics dashboard."""
+    import tempfile
+
+    print("=== Parallel Analytics Dashboard ===")
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    if len(sys.argv) > 1:
+        print(f"Aggregating dataset: {sys.argv[1]}")
+        print()
+        compare_runs(sys.argv[1], workers)
+        return
+
+    # Sample data, one player per chunk file
+    data = create_sample_data()
+    players = data["players"]
+    achievements = data["achievements"]
+    with tempfile.TemporaryDirectory() as directory:
+        write_dataset(
+            directory, records_from_data(players, achievements), chunk_size=1
+        )
+        results = parallel_dashboard(directory, workers=2)
+    analysis = combined_analysis(players, achievements)
+    matches = (
+        results["top_performer"] == analysis["top_performer"]
+        and results["average_score"] == analysis["average_score"]
+    )
+    print(f"Sample data matches combined analysis: {matches}")
+
+    # Synthetic dataset, one chunk file per partition
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_dataset(
+            directory, synthetic_records(200000), chunk_size=12500
+        )
+        print(f"Synthetic dataset: 200000 players in {len(paths)} chunks")
+        print()
+        compare_runs(directory, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Out-of-Core Analytics Dashboard - Streaming Over Chunked Files.
+
+Demonstrates:
+- Storing players as JSON Lines split into fixed-size chunk files
+- Streaming records one line at a time with bounded memory
+- Computing every dashboard section in a single pass
+- Aggregating into partial states that merge and finalize at the end
+
+Each line holds one player together with their achievements:
+    {"name": "alice", "score": 2300, "level": 15, "active": true,
+     "region": "north", "achievements": ["first_kill", ...]}
+
+Usage (from the repository root):
+    python3 -m ex6.ft_dashboard_stream [dataset_directory]
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+
+from ex6.ft_analytics_dashboard import (
+    combined_analysis,
+    create_sample_data,
+    set_comprehension_examples,
+)
+
+# Name of the chunk files written by write_dataset
+CHUNK_NAME = re.compile(r"players-(\d+)\.jsonl")
+
+
+def records_from_data(players, achievements):
+    """
+    Join players with their achievements into dataset records.
+
+    Args:
+        players: List of player dictionaries
+        achievements: Dict of player achievements
+
+    Yields:
+        dict: Player record with an "achievements" list
+    """
+    for player in players:
+        record = dict(player)
+        record["achievements"] = list(achievements.get(player["name"], []))
+        yield record
+
+
+def write_dataset(directory, records, chunk_size=100000):
+    """
+    Write records as JSON Lines chunk files.
+
+    Args:
+        directory: Output directory (created if missing)
+        records: Iterable of player records
+        chunk_size: Number of records per chunk file
+
+    Returns:
+        list: Paths of the written chunk files
+
+    Raises:
+        ValueError: If chunk_size is smaller than 1
+        FileExistsError: If the directory already holds *.jsonl files,
+        which dataset_paths would mix into the new dataset
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    os.makedirs(directory, exist_ok=True)
+    if glob.glob(os.path.join(directory, "*.jsonl")):
+        raise FileExistsError(
+            f"dataset directory '{directory}' already contains *.jsonl "
+            "files; write to an empty directory"
+        )
+    paths = []
+    file = None
+    try:
+        for index, record in enumerate(records):
+            if index % chunk_size == 0:
+                if file:
+                    file.close()
+                path = os.path.join(
+                    directory, f"players-{len(paths):05d}.jsonl"
+                )
+                paths.append(path)
+                file = open(path, "w")
+            file.write(json.dumps(record, separators=(",", ":")))
+            file.write("\n")
+    finally:
+        if file:
+            file.close()
+    return paths
+
+
+def chunk_order(path):
+    """Sort key putting chunk files in write order, other files last."""
+    match = CHUNK_NAME.fullmatch(os.path.basename(path))
+    if match:
+        return (0, int(match.group(1)), path)
+    return (1, 0, path)
+
+
+def dataset_paths(source):
+    """
+    Resolve a dataset to its chunk files in order.
+
+    Chunk files are ordered by their numeric index, so players-100000
+    follows players-99999 even though it sorts first as a string.
+
+    Args:
+        source: Directory of *.jsonl chunks, a single file, or a list
+
+    Returns:
+        list: Chunk file paths
+    """
+    if isinstance(source, (list, tuple)):
+        return list(source)
+    if os.path.isdir(source):
+        return sorted(
+            glob.glob(os.path.join(source, "*.jsonl")), key=chunk_order
+        )
+    return [source]
+
+
+def iter_records(paths):
+    """
+    Stream player records from chunk files, one line at a time.
+
+    Args:
+        paths: Chunk file paths
+
+    Yields:
+        dict: Player record
+    """
+    for path in paths:
+        with open(path) as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def aggregate_records(records, sample_limit=100):
+    """
+    Aggregate records into a partial dashboard state in one pass.
+
+    Memory is bounded by the number of distinct regions and
+    achievements; only the first `sample_limit` high scorer names are
+    kept.
+
+    Args:
+        records: Iterable of player records
+        sample_limit: Number of high scorer names to keep
+
+    Returns:
+        dict: Partial state, see finalize_state
+    """
+    total_players = 0
+    total_score = 0
+    high = 0
+    medium = 0
+    low = 0
+    high_scorers = []
+    active_regions = set()
+    unique_achievements = set()
+    top_key = None
+    top_name = None
+
+    for record in records:
+        score = record["score"]
+        achievements = record["achievements"]
+        total_players += 1
+        total_score += score
+        if score > 2000:
+            high += 1
+            if len(high_scorers) < sample_limit:
+                high_scorers.append(record["name"])
+        elif score >= 1500:
+            medium += 1
+        else:
+            low += 1
+        if record["active"]:
+            active_regions.add(record["region"])
+        unique_achievements.update(achievements)
+        # Strictly greater keeps the first player on ties, like max()
+        key = (score, len(achievements))
+        if top_key is None or key > top_key:
+            top_key = key
+            top_name = record["name"]
+
+    return {
+        "total_players": total_players,
+        "total_score": total_score,
+        "score_categories": {"high": high, "medium": medium, "low": low},
+        "high_scorers": high_scorers,
+        "sample_limit": sample_limit,
+        "active_regions": active_regions,
+        "unique_achievements": unique_achievements,
+        "top_performer": (top_key, top_name),
+    }
+
+
+def merge_states(first, second):
+    """
+    Combine the partial states of two consecutive partitions.
+
+    `first` must come from the records preceding those of `second`, so
+    that the high scorer sample and top performer ties resolve exactly
+    as in a single serial pass.
+
+    Args:
+        first: Partial state of the earlier partition
+        second: Partial state of the later partition
+
+    Returns:
+        dict: Partial state covering both partitions
+    """
+    first_categories = first["score_categories"]
+    second_categories = second["score_categories"]
+    sample_limit = first["sample_limit"]
+    first_key, _ = first["top_performer"]
+    second_key, _ = second["top_performer"]
+    if second_key is not None and (first_key is None
+                                   or second_key > first_key):
+        top_performer = second["top_performer"]
+    else:
+        top_performer = first["top_performer"]
+    return {
+        "total_players": first["total_players"] + second["total_players"],
+        "total_score": first["total_score"] + second["total_score"],
+        "score_categories": {
+            category: first_categories[category] + second_categories[category]
+            for category in first_categories
+        },
+        "high_scorers": (
+            first["high_scorers"] + second["high_scorers"]
+        )[:sample_limit],
+        "sample_limit": sample_limit,
+        "active_regions": first["active_regions"] | second["active_regions"],
+        "unique_achievements": (
+            first["unique_achievements"] | second["unique_achievements"]
+        ),
+        "top_performer": top_performer,
+    }
+
+
+def merge_into(total, state):
+    """
+    Fold the partial state of the next partition into `total` in place.
+
+    Same result as merge_states(total, state) without copying the
+    accumulated sets and lists on every partition.
+
+    Args:
+        total: Partial state of the earlier partitions, updated in place
+        state: Partial state of the next partition
+
+    Returns:
+        dict: The updated total
+    """
+    total["total_players"] += state["total_players"]
+    total["total_score"] += state["total_score"]
+    categories = total["score_categories"]
+    for category, count in state["score_categories"].items():
+        categories[category] += count
+    room = total["sample_limit"] - len(total["high_scorers"])
+    if room > 0:
+        total["high_scorers"] += state["high_scorers"][:room]
+    total["active_regions"] |= state["active_regions"]
+    total["unique_achievements"] |= state["unique_achievements"]
+    total_key, _ = total["top_performer"]
+    state_key, _ = state["top_performer"]
+    if state_key is not None and (total_key is None or state_key > total_key):
+        total["top_performer"] = state["top_performer"]
+    return total
+
+
+def finalize_state(state):
+    """
+    Turn a partial state into the dashboard sections.
+
+    Args:
+        state: Result of aggregate_records
+
+    Returns:
+        dict: High scorers, score categories, active regions, totals,
+        average score, and top performer
+    """
+    total_players = state["total_players"]
+    average_score = (
+        state["total_score"] / total_players if total_players > 0 else 0
+    )
+    top_key, top_name = state["top_performer"]
+    top_performer = None
+    if top_key is not None:
+        top_performer = {
+            "name": top_name,
+            "score": top_key[0],
+            "achievements": top_key[1],
+        }
+    return {
+        "high_scorers": state["high_scorers"],
+        "high_scorer_count": state["score_categories"]["high"],
+        "score_categories": dict(state["score_categories"]),
+        "active_regions": set(state["active_regions"]),
+        "total_players": total_players,
+        "total_unique_achievements": len(state["unique_achievements"]),
+        "average_score": average_score,
+        "top_performer": top_performer,
+    }
+
+
+def streaming_dashboard(source, sample_limit=100):
+    """
+    Compute the dashboard of an on-disk dataset in one streaming pass.
+
+    Args:
+        source: Directory of *.jsonl chunks, a single file, or a list
+        sample_limit: Number of high scorer names to keep
+
+    Returns:
+        dict: Dashboard sections, see finalize_state
+    """
+    records = iter_records(dataset_paths(source))
+    return finalize_state(aggregate_records(records, sample_limit))
+
+
+def print_dashboard(results):
+    """Display the dashboard sections."""
+    print(f"High scorers (>2000): {results['high_scorers']} "
+          f"({results['high_scorer_count']} total)")
+    print(f"Score categories: {results['score_categories']}")
+    print(f"Active regions: {sorted(results['active_regions'])}")
+    print(f"Total players: {results['total_players']}")
+    print(f"Total unique achievements: "
+          f"{results['total_unique_achievements']}")
+    print(f"Average score: {results['average_score']}")
+    top = results["top_performer"]
+    if top:
+        print(
+            f"Top performer: {top['name']} ({top['score']} points, "
+            f"{top['achievements']} achievements)"
+        )
+
+
+def main():
+    """Run the out-of-core dashboard."""
+    import tempfile
+
+    print("=== Out-of-Core Analytics Dashboard ===")
+    if len(sys.argv) > 1:
+        print(f"Streaming dataset: {sys.argv[1]}")
+        print()
+        print_dashboard(streaming_dashboard(sys.argv[1]))
+        return
+
+    data = create_sample_data()
+    players = data["players"]
+    achievements = data["achievements"]
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_dataset(
+            directory, records_from_data(players, achievements), chunk_size=2
+        )
+        print(f"Sample data written to {len(paths)} chunk files")
+        print()
+        results = streaming_dashboard(directory)
+        print_dashboard(results)
+
+    # The streaming pass agrees with the in-memory dashboard
+    analysis = combined_analysis(players, achievements)
+    regions = set_comprehension_examples(players, achievements)
+    matches = (
+        results["average_score"] == analysis["average_score"]
+        and results["top_performer"] == analysis["top_performer"]
+        and results["active_regions"] == regions["active_regions"]
+    )
+    print()
+    print(f"Matches in-memory dashboard: {matches}")
+
+
+if __name__ == "__main__":
+    main()
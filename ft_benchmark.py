@@ -0,0 +1,434 @@
+"""
+Data Quest Benchmark Suite - Performance Measurement.
+
+Demonstrates:
+- High resolution timing with time.perf_counter_ns
+- Warmup and repeated runs for stable measurements
+- Peak memory measurement with tracemalloc
+- Parameterized input sizes from 10^3 up to 10^8
+- JSON results for regression comparison
+- Cold-start time of the command-line entry point and every module
+
+Usage (from the repository root):
+    python3 ft_benchmark.py --max-exp 6 --output bench.json
+    python3 ft_benchmark.py --compare bench.json
+    python3 ft_benchmark.py --cases distance --cold-start
+"""
+
+import argparse
+import collections
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ex0.ft_command_quest import dispatch_commands
+from ex2.ft_coordinate_system import (
+    calculate_distance,
+    calculate_distances,
+)
+from ex3.ft_achievement_tracker import (
+    get_all_achievements,
+    get_common_achievements,
+    get_rare_achievements,
+)
+from ex4.ft_inventory_system import (
+    categorize_items,
+    get_sorted_items,
+    parse_inventory,
+)
+from ex5.ft_data_stream import (
+    count_high_level_players,
+    fibonacci_generator,
+    game_event_generator,
+    prime_generator,
+)
+from ex6.ft_analytics_dashboard import (
+    combined_analysis,
+    dict_comprehension_examples,
+    list_comprehension_examples,
+    set_comprehension_examples,
+)
+
+ACHIEVEMENT_POOL = [f"achievement_{i}" for i in range(50)]
+REGIONS = ["north", "east", "south", "west", "central"]
+
+# Modules whose import time is measured by --cold-start
+COLD_START_MODULES = [
+    "ft_data_quest",
+    "ex0.ft_command_quest",
+    "ex1.ft_score_analytics",
+    "ex2.ft_coordinate_system",
+    "ex3.ft_achievement_tracker",
+    "ex4.ft_inventory_system",
+    "ex5.ft_data_stream",
+    "ex5.ft_event_log",
+    "ex5.ft_stream_sketches",
+    "ex6.ft_analytics_dashboard",
+    "ex6.ft_dashboard_stream",
+    "ex6.ft_dashboard_parallel",
+]
+
+
+def consume(iterator):
+    """Exhaust an iterator without keeping its items."""
+    collections.deque(iterator, maxlen=0)
+
+
+class NullSink(io.RawIOBase):
+    """Binary output stream discarding everything written to it."""
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return len(data)
+
+
+def setup_commands(size):
+    """Create `size` batch-mode command lines."""
+    rng = random.Random(42)
+    templates = ["echo hello world", "count a b c", "sum 1 2 3"]
+    return [rng.choice(templates) for _ in range(size)]
+
+
+def run_command_dispatch(commands):
+    """Dispatch every command, discarding the output."""
+    dispatch_commands(commands, NullSink())
+
+
+def setup_points(size):
+    """Create `size` pairs of random 3D points."""
+    rng = random.Random(42)
+    return [
+        (
+            (rng.randint(-1000, 1000), rng.randint(-1000, 1000),
+             rng.randint(-1000, 1000)),
+            (rng.randint(-1000, 1000), rng.randint(-1000, 1000),
+             rng.randint(-1000, 1000)),
+        )
+        for _ in range(size)
+    ]
+
+
+def run_distances(pairs):
+    """Compute the distance of every point pair."""
+    for point1, point2 in pairs:
+        calculate_distance(point1, point2)
+
+
+def setup_batch_points(size):
+    """Create an origin and `size` random 3D points."""
+    rng = random.Random(42)
+    return (0, 0, 0), [
+        (rng.randint(-1000, 1000), rng.randint(-1000, 1000),
+         rng.randint(-1000, 1000))
+        for _ in range(size)
+    ]
+
+
+def run_batch_distances(data):
+    """Compute the distance from the origin to every point at once."""
+    origin, points = data
+    calculate_distances(origin, points)
+
+
+def setup_achievements(size):
+    """Create `size` players with random achievement sets."""
+    rng = random.Random(42)
+    return {
+        f"player_{i}": set(rng.sample(ACHIEVEMENT_POOL, rng.randint(1, 10)))
+        for i in range(size)
+    }
+
+
+def run_set_operations(players):
+    """Run every achievement set operation over all players."""
+    get_all_achievements(players)
+    get_common_achievements(players)
+    get_rare_achievements(players)
+
+
+def setup_inventory_args(size):
+    """Create `size` command-line style 'item:quantity' arguments."""
+    rng = random.Random(42)
+    return [f"item_{i}:{rng.randint(1, 20)}" for i in range(size)]
+
+
+def run_inventory_queries(args):
+    """Parse an inventory and run the sorting and category queries."""
+    inventory = parse_inventory(args)
+    get_sorted_items(inventory)
+    categorize_items(inventory)
+
+
+def setup_dashboard(size):
+    """Create `size` players and their achievement lists."""
+    rng = random.Random(42)
+    players = [
+        {
+            "name": f"player_{i}",
+            "score": rng.randint(0, 3000),
+            "level": rng.randint(1, 20),
+            "active": rng.random() < 0.75,
+            "region": rng.choice(REGIONS),
+        }
+        for i in range(size)
+    ]
+    achievements = {
+        p["name"]: rng.sample(ACHIEVEMENT_POOL, rng.randint(1, 10))
+        for p in players
+    }
+    return players, achievements
+
+
+def run_dashboard(data):
+    """Compute every dashboard aggregate."""
+    players, achievements = data
+    list_comprehension_examples(players)
+    dict_comprehension_examples(players, achievements)
+    set_comprehension_examples(players, achievements)
+    combined_analysis(players, achievements)
+
+
+# name -> (setup(size), run(data), largest supported exponent)
+# The caps keep the input data (or the algorithm itself) inside a
+# realistic budget: trial-division primes and big-int Fibonacci grow
+# super-linearly, the materialized inputs grow linearly in memory.
+CASES = {
+    "event_generation": (
+        lambda size: size,
+        lambda size: consume(game_event_generator(size)),
+        8,
+    ),
+    "stream_high_level": (
+        lambda size: size,
+        lambda size: count_high_level_players(game_event_generator(size)),
+        8,
+    ),
+    "fibonacci": (
+        lambda size: size,
+        lambda size: consume(fibonacci_generator(size)),
+        5,
+    ),
+    "primes": (
+        lambda size: size,
+        lambda size: consume(prime_generator(size)),
+        5,
+    ),
+    "command_dispatch": (setup_commands, run_command_dispatch, 7),
+    "distance": (setup_points, run_distances, 7),
+    "distance_batch": (setup_batch_points, run_batch_distances, 7),
+    "set_operations": (setup_achievements, run_set_operations, 6),
+    "inventory_queries": (setup_inventory_args, run_inventory_queries, 7),
+    "dashboard": (setup_dashboard, run_dashboard, 6),
+}
+
+
+def time_case(run, data, warmup, repeat):
+    """
+    Time a benchmark case.
+
+    Args:
+        run: Callable executing the measured work
+        data: Input prepared by the setup function
+        warmup: Number of untimed runs
+        repeat: Number of timed runs
+
+    Returns:
+        list: Duration of every timed run in nanoseconds
+    """
+    for _ in range(warmup):
+        run(data)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run(data)
+        timings.append(time.perf_counter_ns() - start)
+    return timings
+
+
+def measure_peak_memory(run, data):
+    """Return the peak memory in bytes allocated by one run."""
+    tracemalloc.start()
+    try:
+        run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(names, exponents, warmup, repeat):
+    """
+    Run the selected benchmark cases for every input size.
+
+    Args:
+        names: Names of the cases to run
+        exponents: Input sizes as powers of ten
+        warmup: Number of untimed runs per measurement
+        repeat: Number of timed runs per measurement
+
+    Returns:
+        list: One result dict per case and size
+    """
+    results = []
+    for name in names:
+        setup, run, max_exp = CASES[name]
+        for exp in exponents:
+            size = 10**exp
+            if exp > max_exp:
+                print(f"{name} n=10^{exp}: skipped (limit 10^{max_exp})",
+                      file=sys.stderr)
+                continue
+            data = setup(size)
+            timings = time_case(run, data, warmup, repeat)
+            peak = measure_peak_memory(run, data)
+            median = statistics.median(timings)
+            results.append({
+                "case": name,
+                "size": size,
+                "ns": {
+                    "min": min(timings),
+                    "median": median,
+                    "mean": statistics.fmean(timings),
+                    "stdev": (statistics.stdev(timings)
+                              if len(timings) > 1 else 0.0),
+                },
+                "ns_per_item": median / size,
+                "peak_bytes": peak,
+            })
+            print(f"{name} n=10^{exp}: {median / 1e6:.3f} ms median, "
+                  f"{peak / 1024:.1f} KiB peak", file=sys.stderr)
+            del data
+    return results
+
+
+def measure_cold_start(modules, repeat):
+    """
+    Measure the time a fresh interpreter needs to import each module.
+
+    Args:
+        modules: Module names, importable from the repository root
+        repeat: Number of interpreter launches per module
+
+    Returns:
+        dict: Median wall time and import overhead in nanoseconds per
+        module; the overhead subtracts a bare interpreter start
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+
+    def launch(code):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            subprocess.run([sys.executable, "-c", code], cwd=root,
+                           check=True, stdout=subprocess.DEVNULL)
+            timings.append(time.perf_counter_ns() - start)
+        return statistics.median(timings)
+
+    baseline = launch("pass")
+    results = {"interpreter": {"median_ns": baseline, "overhead_ns": 0}}
+    for module in modules:
+        median = launch(f"import {module}")
+        results[module] = {
+            "median_ns": median,
+            "overhead_ns": median - baseline,
+        }
+        print(f"cold start {module}: {(median - baseline) / 1e6:.2f} ms "
+              f"over a bare interpreter", file=sys.stderr)
+    return results
+
+
+def compare_results(baseline, current, threshold):
+    """
+    Compare two result lists by median time.
+
+    Args:
+        baseline: Results loaded from an earlier run
+        current: Results of this run
+        threshold: Ratio above which a case counts as a regression
+
+    Returns:
+        list: (case, size, ratio) tuples of the regressed cases
+    """
+    old = {(r["case"], r["size"]): r["ns"]["median"] for r in baseline}
+    regressions = []
+    for result in current:
+        key = (result["case"], result["size"])
+        if key not in old:
+            continue
+        ratio = result["ns"]["median"] / old[key]
+        print(f"{key[0]} n={key[1]}: {ratio:.2f}x baseline", file=sys.stderr)
+        if ratio > threshold:
+            regressions.append((key[0], key[1], ratio))
+    return regressions
+
+
+def parse_args(argv):
+    """Parse the benchmark command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES),
+                        default=list(CASES), help="cases to run")
+    parser.add_argument("--min-exp", type=int, default=3,
+                        help="smallest input size as power of ten")
+    parser.add_argument("--max-exp", type=int, default=5,
+                        help="largest input size as power of ten (up to 8)")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare to")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="also measure module cold-start times")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="slowdown ratio reported as a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the benchmark suite."""
+    args = parse_args(argv)
+    exponents = range(args.min_exp, min(args.max_exp, 8) + 1)
+    results = run_benchmarks(args.cases, exponents, args.warmup,
+                             args.repeat)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.time(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.cold_start:
+        report["cold_start"] = measure_cold_start(COLD_START_MODULES,
+                                                  args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare_results(baseline, results, args.threshold)
+        for case, size, ratio in regressions:
+            print(f"❌ Regression: {case} n={size} ({ratio:.2f}x)",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
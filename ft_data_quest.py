@@ -0,0 +1,83 @@
+"""
+Data Quest - Command-Line Entry Point.
+
+Demonstrates:
+- Dispatching subcommands to the exercise modules
+- Importing only the module of the chosen subcommand
+- Keeping cold start cheap for short-lived worker processes
+
+Usage (from the repository root, or `data-quest` once installed):
+    python3 ft_data_quest.py <command> [arguments...]
+"""
+
+import importlib
+import os
+import sys
+
+# Subcommand -> (module, description); modules are imported on dispatch
+COMMANDS = {
+    "command": ("ex0.ft_command_quest", "Echo command-line arguments"),
+    "scores": ("ex1.ft_score_analytics", "Score statistics"),
+    "coordinates": ("ex2.ft_coordinate_system", "3D coordinate system"),
+    "achievements": ("ex3.ft_achievement_tracker", "Achievement tracker"),
+    "inventory": ("ex4.ft_inventory_system", "Inventory system"),
+    "stream": ("ex5.ft_data_stream", "Game data stream processor"),
+    "event-log": ("ex5.ft_event_log", "Binary event log replay"),
+    "sketches": ("ex5.ft_stream_sketches", "Stream sketches"),
+    "dashboard": ("ex6.ft_analytics_dashboard", "Analytics dashboard"),
+    "dashboard-stream": ("ex6.ft_dashboard_stream", "Out-of-core dashboard"),
+    "dashboard-parallel": (
+        "ex6.ft_dashboard_parallel", "Parallel partitioned dashboard"
+    ),
+    "bench": ("ft_benchmark", "Benchmark suite"),
+    "telemetry": ("ft_telemetry", "Hot-path telemetry demo"),
+}
+
+
+def print_usage(program):
+    """Print the available subcommands."""
+    print(f"Usage: {program} <command> [arguments...]")
+    print()
+    print("Commands:")
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:<20}{description}")
+
+
+def main(argv=None):
+    """
+    Dispatch to the main function of a subcommand.
+
+    The subcommand sees its own arguments in sys.argv, exactly as if its
+    module had been run as a script.
+
+    Args:
+        argv: Full argument vector (defaults to sys.argv)
+
+    Returns:
+        int: Exit status
+    """
+    argv = sys.argv if argv is None else argv
+    program = os.path.basename(argv[0]) if argv else "data-quest"
+    if len(argv) < 2 or argv[1] in ("-h", "--help"):
+        print_usage(program)
+        return 0
+
+    name = argv[1]
+    if name not in COMMANDS:
+        print(f"❌ Unknown command: '{name}'", file=sys.stderr)
+        print_usage(program)
+        return 2
+
+    if os.environ.get("FT_TELEMETRY", "") not in ("", "0"):
+        # Only paid for when telemetry is switched on
+        import ft_telemetry
+        ft_telemetry.instrument_all()
+
+    module = importlib.import_module(COMMANDS[name][0])
+    sys.argv = [f"{program} {name}"] + list(argv[2:])
+    status = module.main()
+    return status if isinstance(status, int) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
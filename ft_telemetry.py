@@ -0,0 +1,489 @@
+"""
+Telemetry - Hot-Path Instrumentation for the Exercise Modules.
+
+Demonstrates:
+- Decorators and context managers recording calls, latency and items
+- Latency histograms with fixed power-of-four buckets
+- Zero cost when disabled: functions are left unwrapped
+- Instrumenting existing modules without editing them
+- Pluggable exporters (registry snapshot, JSON, Prometheus text format)
+
+Telemetry is enabled with the FT_TELEMETRY=1 environment variable.
+FT_TELEMETRY_EXPORT=<exporter>:<path> writes the metrics at exit, e.g.
+FT_TELEMETRY_EXPORT=prometheus:/var/lib/node_exporter/ft.prom
+
+Usage (from the repository root):
+    python3 ft_telemetry.py
+"""
+
+import atexit
+import bisect
+import functools
+import importlib
+import inspect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("FT_TELEMETRY", "") not in ("", "0")
+
+# Upper bounds of the latency buckets in nanoseconds (1 us to ~4.5 min)
+BUCKETS_NS = tuple(1000 * 4**i for i in range(14))
+
+
+def _first_len(args, result):
+    """Count the items of the first positional argument."""
+    return len(args[0])
+
+
+def _result_len(args, result):
+    """Count the items of the returned collection."""
+    return len(result)
+
+
+# Items counter counting the values the function consumes from the
+# iterable passed as its first positional argument
+CONSUMED = "consumed"
+
+
+class _CountingIterator:
+    """Iterator counting the values taken from another iterable."""
+
+    __slots__ = ("iterator", "count")
+
+    def __init__(self, iterable):
+        self.iterator = iter(iterable)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        value = next(self.iterator)
+        self.count += 1
+        return value
+
+
+# Module -> {function name: items counter (None counts one per call)}
+HOT_PATHS = {
+    "ex0.ft_command_quest": {
+        "dispatch_commands": lambda args, result: result[0],
+    },
+    "ex1.ft_score_analytics": {
+        "parse_scores": _first_len,
+        "calculate_statistics": _first_len,
+    },
+    "ex2.ft_coordinate_system": {
+        "calculate_distance": None,
+        "calculate_distances": _result_len,
+        "parse_coordinates": None,
+    },
+    "ex3.ft_achievement_tracker": {
+        "get_all_achievements": _first_len,
+        "get_common_achievements": _first_len,
+        "get_rare_achievements": _first_len,
+    },
+    "ex4.ft_inventory_system": {
+        "parse_inventory": _first_len,
+        "get_sorted_items": _first_len,
+        "categorize_items": _first_len,
+        "get_restock_items": _first_len,
+    },
+    "ex5.ft_data_stream": {
+        "game_event_generator": None,
+        "fibonacci_generator": None,
+        "prime_generator": None,
+        "count_high_level_players": CONSUMED,
+        "count_action_events": CONSUMED,
+    },
+    "ex5.ft_event_log": {
+        "write_events": lambda args, result: result,
+        "replay_counts": lambda args, result: result["total"],
+    },
+    "ex6.ft_analytics_dashboard": {
+        "list_comprehension_examples": _first_len,
+        "dict_comprehension_examples": _first_len,
+        "set_comprehension_examples": _first_len,
+        "combined_analysis": _first_len,
+    },
+    "ex6.ft_dashboard_stream": {
+        "aggregate_records": lambda args, result: result["total_players"],
+    },
+}
+
+
+class Metric:
+    """Call count, item count and latency histogram of one hot path."""
+
+    __slots__ = ("name", "calls", "items", "total_ns", "buckets")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.items = 0
+        self.total_ns = 0
+        self.buckets = [0] * (len(BUCKETS_NS) + 1)
+
+    def observe(self, elapsed_ns, items=1):
+        """Record one call."""
+        self.calls += 1
+        self.items += items
+        self.total_ns += elapsed_ns
+        self.buckets[bisect.bisect_left(BUCKETS_NS, elapsed_ns)] += 1
+
+    def as_dict(self):
+        """Return the metric as a JSON-serializable dict."""
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "total_ns": self.total_ns,
+            "buckets": dict(zip(map(str, BUCKETS_NS + ("+Inf",)),
+                                self.buckets)),
+        }
+
+
+REGISTRY = {}
+_registry_lock = threading.Lock()
+
+
+def get_metric(name):
+    """Return the metric called `name`, creating it if needed."""
+    metric = REGISTRY.get(name)
+    if metric is None:
+        with _registry_lock:
+            metric = REGISTRY.setdefault(name, Metric(name))
+    return metric
+
+
+def reset():
+    """Remove every recorded metric."""
+    with _registry_lock:
+        REGISTRY.clear()
+
+
+def wrap(func, name=None, items=None):
+    """
+    Return an instrumented version of a function.
+
+    Generator functions are timed while they run (not while the consumer
+    does) and count every yielded value as an item. Calls that raise are
+    recorded with no items.
+
+    Args:
+        func: Function to instrument
+        name: Metric name (defaults to module.qualname)
+        items: Callable (args, result) -> item count, None counts 1,
+            CONSUMED counts the values taken from the first argument
+
+    Returns:
+        function: Wrapper recording into the registry
+    """
+    metric = get_metric(name or f"{func.__module__}.{func.__qualname__}")
+    clock = time.perf_counter_ns
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            iterator = func(*args, **kwargs)
+            elapsed = 0
+            count = 0
+            try:
+                while True:
+                    start = clock()
+                    try:
+                        value = next(iterator)
+                    except StopIteration:
+                        break
+                    finally:
+                        elapsed += clock() - start
+                    count += 1
+                    yield value
+            finally:
+                metric.observe(elapsed, count)
+
+        generator_wrapper.ft_metric = metric
+        return generator_wrapper
+
+    if items == CONSUMED:
+        @functools.wraps(func)
+        def consuming_wrapper(iterable, *args, **kwargs):
+            counter = _CountingIterator(iterable)
+            start = clock()
+            try:
+                return func(counter, *args, **kwargs)
+            finally:
+                metric.observe(clock() - start, counter.count)
+
+        consuming_wrapper.ft_metric = metric
+        return consuming_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        count = 0
+        try:
+            result = func(*args, **kwargs)
+            count = items(args, result) if items else 1
+            return result
+        finally:
+            metric.observe(clock() - start, count)
+
+    wrapper.ft_metric = metric
+    return wrapper
+
+
+def traced(name=None, items=None):
+    """
+    Decorate a function for instrumentation.
+
+    When telemetry is disabled the function is returned unchanged.
+
+    Args:
+        name: Metric name (defaults to module.qualname)
+        items: Callable (args, result) -> item count, or CONSUMED
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        return wrap(func, name, items)
+    return decorate
+
+
+class _Timer:
+    """Context manager timing a block into a metric."""
+
+    __slots__ = ("metric", "items", "start")
+
+    def __init__(self, metric, items):
+        self.metric = metric
+        self.items = items
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.metric.observe(time.perf_counter_ns() - self.start, self.items)
+        return False
+
+
+class _NullTimer:
+    """Context manager doing nothing, used while telemetry is disabled."""
+
+    items = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timed(name, items=1):
+    """
+    Time a block of code; set `.items` on the result to count items.
+
+    Args:
+        name: Metric name
+        items: Items processed by the block
+    """
+    if not ENABLED:
+        return _NULL_TIMER
+    return _Timer(get_metric(name), items)
+
+
+def instrument(module, functions):
+    """
+    Replace functions of a module with instrumented versions.
+
+    Calls inside the module go through its globals and are recorded
+    too; modules that imported a function by name before this call
+    keep the original.
+
+    Args:
+        module: Module object to patch
+        functions: Dict of function name -> items counter
+    """
+    for name, items in functions.items():
+        func = getattr(module, name)
+        if hasattr(func, "ft_metric"):
+            continue
+        metric_name = f"{module.__name__}.{name}"
+        setattr(module, name, wrap(func, metric_name, items))
+
+
+def instrument_all(force=False):
+    """
+    Instrument every hot path in HOT_PATHS.
+
+    Call this before importing code that imports the hot paths by name.
+
+    Args:
+        force: Instrument even if FT_TELEMETRY is not set
+    """
+    if not (ENABLED or force):
+        return
+    for module_name, functions in HOT_PATHS.items():
+        instrument(importlib.import_module(module_name), functions)
+
+
+def snapshot():
+    """Return every metric of the in-process registry as a dict."""
+    with _registry_lock:
+        metrics = list(REGISTRY.values())
+    return {metric.name: metric.as_dict() for metric in metrics}
+
+
+def to_json():
+    """Return the registry as a JSON document."""
+    return json.dumps(snapshot(), indent=2)
+
+
+def to_prometheus():
+    """Return the registry in the Prometheus text exposition format."""
+    with _registry_lock:
+        metrics = sorted(REGISTRY.values(), key=lambda m: m.name)
+    lines = [
+        "# HELP ft_calls_total Number of calls of a hot path.",
+        "# TYPE ft_calls_total counter",
+    ]
+    lines += [f'ft_calls_total{{function="{m.name}"}} {m.calls}'
+              for m in metrics]
+    lines += [
+        "# HELP ft_items_total Number of items processed by a hot path.",
+        "# TYPE ft_items_total counter",
+    ]
+    lines += [f'ft_items_total{{function="{m.name}"}} {m.items}'
+              for m in metrics]
+    lines += [
+        "# HELP ft_latency_seconds Latency of a hot path.",
+        "# TYPE ft_latency_seconds histogram",
+    ]
+    for metric in metrics:
+        label = f'function="{metric.name}"'
+        cumulative = 0
+        for bound, count in zip(BUCKETS_NS, metric.buckets):
+            cumulative += count
+            # repr() keeps every digit, e.g. 67.108864 rather than 67.1089
+            lines.append(f'ft_latency_seconds_bucket{{{label},'
+                         f'le="{bound / 1e9!r}"}} {cumulative}')
+        lines.append(f'ft_latency_seconds_bucket{{{label},le="+Inf"}} '
+                     f'{metric.calls}')
+        lines.append(f"ft_latency_seconds_sum{{{label}}} "
+                     f"{metric.total_ns / 1e9:.9f}")
+        lines.append(f"ft_latency_seconds_count{{{label}}} {metric.calls}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path, text):
+    """Write a file so readers never see a partial export."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as file:
+        file.write(text)
+    os.replace(temp_path, path)
+
+
+def write_json(path):
+    """Export the registry as JSON to a file."""
+    _write_atomic(path, to_json())
+
+
+def write_prometheus(path):
+    """Export the registry in Prometheus text format to a file."""
+    _write_atomic(path, to_prometheus())
+
+
+# Exporter name -> callable(path); extend with register_exporter
+EXPORTERS = {
+    "json": write_json,
+    "prometheus": write_prometheus,
+}
+
+
+def register_exporter(name, exporter):
+    """Register an exporter callable taking a destination path."""
+    EXPORTERS[name] = exporter
+
+
+def export(spec):
+    """
+    Export the registry according to an '<exporter>:<path>' spec.
+
+    Args:
+        spec: Exporter name and destination, e.g. 'json:metrics.json'
+    """
+    name, _, path = spec.partition(":")
+    if name not in EXPORTERS:
+        raise ValueError(f"unknown telemetry exporter: {name}")
+    EXPORTERS[name](path)
+
+
+def serve_prometheus(port=9464, host="127.0.0.1"):
+    """
+    Serve the registry on a local HTTP endpoint in a daemon thread.
+
+    Args:
+        port: TCP port to listen on
+        host: Interface to bind (local only by default)
+
+    Returns:
+        ThreadingHTTPServer: The running server, call shutdown() to stop
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type",
+                             "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if ENABLED and os.environ.get("FT_TELEMETRY_EXPORT"):
+    atexit.register(export, os.environ["FT_TELEMETRY_EXPORT"])
+
+
+def main():
+    """Run the telemetry demonstration."""
+    print("=== Hot-Path Telemetry ===")
+    instrument_all(force=True)
+
+    from ex2.ft_coordinate_system import calculate_distance
+    from ex4.ft_inventory_system import get_sorted_items, parse_inventory
+    from ex5.ft_data_stream import count_high_level_players
+    from ex5.ft_data_stream import game_event_generator
+
+    for i in range(1000):
+        calculate_distance((0, 0, 0), (i, i, i))
+    inventory = parse_inventory([f"item_{i}:{i % 7 + 1}" for i in range(500)])
+    get_sorted_items(inventory)
+    count_high_level_players(game_event_generator(1000))
+
+    for name, metric in sorted(snapshot().items()):
+        if not metric["calls"]:
+            continue
+        mean_us = metric["total_ns"] / metric["calls"] / 1000
+        print(f"{name}: {metric['calls']} calls, {metric['items']} items, "
+              f"{mean_us:.2f} us mean")
+
+    print()
+    print("=== Prometheus Export (excerpt) ===")
+    print("\n".join(to_prometheus().splitlines()[:4]))
+
+
+if __name__ == "__main__":
+    main()
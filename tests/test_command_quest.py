@@ -0,0 +1,67 @@
+"""Tests for the batch mode of ex0/ft_command_quest.py."""
+
+import io
+import sys
+
+import pytest
+
+from ex0 import ft_command_quest
+from ex0.ft_command_quest import dispatch_commands, read_commands
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    """Register extra handlers for one test only."""
+    registered = dict(ft_command_quest.HANDLERS)
+    monkeypatch.setattr(ft_command_quest, "HANDLERS", registered)
+    registered["div"] = lambda args: str(int(args[0]) // int(args[1]))
+    registered["first"] = lambda args: args[0]
+    registered["number"] = lambda args: len(args)
+    registered["quiet"] = lambda args: None
+    return registered
+
+
+def run(commands):
+    """Dispatch commands and return (output lines, processed, failed)."""
+    output = io.BytesIO()
+    processed, failed = dispatch_commands(commands, output)
+    return output.getvalue().decode().split("\n")[:-1], processed, failed
+
+
+def test_read_commands_splits_across_chunks():
+    stream = io.BytesIO(b"echo a\necho b\ncount x y")
+    assert list(read_commands(stream, chunk_size=4)) == [
+        "echo a", "echo b", "count x y",
+    ]
+
+
+def test_read_commands_null_delimited():
+    stream = io.BytesIO(b"echo a b\0count\nx\0")
+    assert list(read_commands(stream, b"\0")) == ["echo a b", "count\nx"]
+
+
+def test_handler_exceptions_do_not_abort_the_run(handlers):
+    lines, processed, failed = run(
+        ["div 6 3", "div 1 0", "first", "sum 1 x", "echo done"]
+    )
+    assert lines[0] == "2"
+    assert lines[1].startswith("Error: div: ZeroDivisionError")
+    assert lines[2].startswith("Error: first: IndexError")
+    assert lines[3].startswith("Error: sum: ValueError")
+    assert lines[4] == "done"
+    assert (processed, failed) == (5, 3)
+
+
+def test_output_stays_aligned_with_input(handlers):
+    commands = ["echo a", "", "quiet", "number x y", "nope", "echo b"]
+    lines, processed, failed = run(commands)
+    assert lines == ["a", "", "", "2", "Error: unknown command 'nope'", "b"]
+    assert len(lines) == len(commands)
+    assert (processed, failed) == (5, 1)
+
+
+def test_missing_file_reports_error(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["ft_command_quest.py", "--file",
+                                      "/nonexistent/commands.txt"])
+    assert ft_command_quest.main() == 2
+    assert "❌" in capsys.readouterr().err
@@ -0,0 +1,40 @@
+"""Tests for the batched distances in ex2/ft_coordinate_system.py."""
+
+import pytest
+
+from ex2 import ft_coordinate_system
+from ex2.ft_coordinate_system import calculate_distances
+
+pytest.importorskip("numpy")
+
+ORIGIN = (1, -2, 0.5)
+
+
+def fallback_distances(origin, points, monkeypatch):
+    """Run calculate_distances as if NumPy were not installed."""
+    with monkeypatch.context() as patch:
+        patch.setattr(ft_coordinate_system, "_numpy", None)
+        return calculate_distances(origin, points)
+
+
+@pytest.mark.parametrize("points", [
+    [],
+    [(0, 0, 0)],
+    [(3, 4, 0), (10, 20, 5), (-1.5, 2.25, 1e6)],
+])
+def test_numpy_matches_fallback(points, monkeypatch):
+    expected = fallback_distances(ORIGIN, points, monkeypatch)
+    assert calculate_distances(ORIGIN, points) == pytest.approx(expected)
+    assert isinstance(calculate_distances(ORIGIN, points), list)
+
+
+@pytest.mark.parametrize("points", [
+    [(1, 2)],
+    [(1, 2, 3, 4)],
+    [(1, 2, 3), (4, 5)],
+])
+def test_malformed_points_raise_on_both_paths(points, monkeypatch):
+    with pytest.raises(ValueError):
+        fallback_distances(ORIGIN, points, monkeypatch)
+    with pytest.raises(ValueError):
+        calculate_distances(ORIGIN, points)
@@ -0,0 +1,169 @@
+"""Tests for merge_states and the parallel dashboard in ex6."""
+
+import copy
+import functools
+
+import pytest
+
+from ex6.ft_analytics_dashboard import (
+    combined_analysis,
+    create_sample_data,
+    dict_comprehension_examples,
+    list_comprehension_examples,
+    set_comprehension_examples,
+)
+from ex6.ft_dashboard_parallel import (
+    parallel_dashboard,
+    pool_size,
+    synthetic_records,
+)
+from ex6.ft_dashboard_stream import (
+    aggregate_records,
+    finalize_state,
+    merge_into,
+    merge_states,
+    records_from_data,
+    streaming_dashboard,
+    write_dataset,
+)
+
+
+def player(name, score, achievements=0, active=True, region="north"):
+    """Build one dataset record."""
+    return {
+        "name": name,
+        "score": score,
+        "level": 1,
+        "active": active,
+        "region": region,
+        "achievements": [f"achievement_{i}" for i in range(achievements)],
+    }
+
+
+def merged(partitions, sample_limit=100):
+    """Aggregate every partition on its own and merge in order."""
+    states = [aggregate_records(part, sample_limit) for part in partitions]
+    return finalize_state(functools.reduce(merge_states, states))
+
+
+def serial(records, sample_limit=100):
+    """Aggregate all records in one serial pass."""
+    return finalize_state(aggregate_records(records, sample_limit))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 50])
+def test_merge_matches_serial_pass(chunk_size):
+    records = list(synthetic_records(50, seed=7))
+    partitions = [records[i:i + chunk_size]
+                  for i in range(0, len(records), chunk_size)]
+    assert merged(partitions, 5) == serial(records, 5)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 50])
+def test_merge_into_matches_merge_states(chunk_size):
+    records = list(synthetic_records(50, seed=11))
+    states = [aggregate_records(records[i:i + chunk_size], 5)
+              for i in range(0, len(records), chunk_size)]
+    originals = copy.deepcopy(states)
+    expected = functools.reduce(merge_states, states)
+    assert states == originals
+
+    total = states[0]
+    for state in states[1:]:
+        merge_into(total, state)
+    assert total == expected
+    assert states[1:] == originals[1:]
+
+
+def test_pool_size_capped_by_partitions():
+    assert pool_size(8, 3) == 3
+    assert pool_size(2, 10) == 2
+    assert pool_size(None, 1) == 1
+    assert pool_size(None, 0) == 1
+
+
+def test_merge_matches_combined_analysis():
+    data = create_sample_data()
+    players = data["players"]
+    achievements = data["achievements"]
+    records = list(records_from_data(players, achievements))
+    results = merged([[record] for record in records])
+
+    analysis = combined_analysis(players, achievements)
+    lists = list_comprehension_examples(players)
+    dicts = dict_comprehension_examples(players, achievements)
+    sets = set_comprehension_examples(players, achievements)
+    assert results["total_players"] == analysis["total_players"]
+    assert (results["total_unique_achievements"]
+            == analysis["total_unique_achievements"])
+    assert results["average_score"] == analysis["average_score"]
+    assert results["top_performer"] == analysis["top_performer"]
+    assert results["high_scorers"] == lists["high_scorers"]
+    assert results["score_categories"] == dicts["score_categories"]
+    assert results["active_regions"] == sets["active_regions"]
+
+
+def test_top_performer_tie_across_partition_boundary():
+    first = [player("a", 100), player("b", 2500, 3)]
+    second = [player("c", 2500, 3), player("d", 10)]
+    results = merged([first, second])
+    assert results["top_performer"]["name"] == "b"
+    assert results == serial(first + second)
+
+    players = [{k: v for k, v in r.items() if k != "achievements"}
+               for r in first + second]
+    achievements = {r["name"]: r["achievements"] for r in first + second}
+    analysis = combined_analysis(players, achievements)
+    assert results["top_performer"] == analysis["top_performer"]
+
+
+def test_top_performer_later_partition_wins_when_greater():
+    first = [player("a", 2500, 3)]
+    second = [player("b", 2500, 4)]
+    assert merged([first, second])["top_performer"]["name"] == "b"
+
+
+def test_high_scorers_truncated_at_sample_limit():
+    first = [player("a", 2100), player("b", 100), player("c", 2200)]
+    second = [player("d", 2300), player("e", 2400)]
+    results = merged([first, second], sample_limit=3)
+    assert results["high_scorers"] == ["a", "c", "d"]
+    assert results["high_scorer_count"] == 4
+    assert results == serial(first + second, sample_limit=3)
+
+
+def test_empty_partitions():
+    results = merged([[], [player("a", 1600)], []])
+    assert results == serial([player("a", 1600)])
+    empty = merged([[], []])
+    assert empty == serial([])
+    assert empty["total_players"] == 0
+    assert empty["average_score"] == 0
+    assert empty["top_performer"] is None
+
+
+def test_parallel_dashboard_matches_streaming(tmp_path):
+    write_dataset(tmp_path, synthetic_records(500, seed=3), chunk_size=60)
+    expected = streaming_dashboard(tmp_path, sample_limit=20)
+    assert parallel_dashboard(tmp_path, workers=2, sample_limit=20) == expected
+
+
+def test_parallel_dashboard_matches_combined_analysis(tmp_path):
+    data = create_sample_data()
+    players = data["players"]
+    achievements = data["achievements"]
+    write_dataset(tmp_path, records_from_data(players, achievements),
+                  chunk_size=1)
+    results = parallel_dashboard(tmp_path, workers=2)
+    analysis = combined_analysis(players, achievements)
+    assert results["average_score"] == analysis["average_score"]
+    assert results["top_performer"] == analysis["top_performer"]
+    assert (results["total_unique_achievements"]
+            == analysis["total_unique_achievements"])
+
+
+def test_parallel_dashboard_empty_dataset(tmp_path):
+    results = parallel_dashboard(tmp_path, workers=2)
+    assert results == streaming_dashboard(tmp_path)
+    assert results["total_players"] == 0
+    assert results["top_performer"] is None
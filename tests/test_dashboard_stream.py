@@ -0,0 +1,46 @@
+"""Tests for the out-of-core dashboard in ex6/ft_dashboard_stream.py."""
+
+import os
+
+import pytest
+
+from ex6.ft_analytics_dashboard import create_sample_data
+from ex6.ft_dashboard_stream import (
+    dataset_paths,
+    records_from_data,
+    streaming_dashboard,
+    write_dataset,
+)
+
+
+def test_write_dataset_refuses_existing_chunks(tmp_path):
+    data = create_sample_data()
+    records = list(records_from_data(data["players"], data["achievements"]))
+    write_dataset(tmp_path, records * 3, chunk_size=2)
+    with pytest.raises(FileExistsError):
+        write_dataset(tmp_path, records, chunk_size=2)
+    assert streaming_dashboard(tmp_path)["total_players"] == 12
+
+
+def test_write_dataset_creates_directory(tmp_path):
+    data = create_sample_data()
+    records = records_from_data(data["players"], data["achievements"])
+    paths = write_dataset(tmp_path / "new", records, chunk_size=3)
+    assert len(paths) == 2
+    assert streaming_dashboard(tmp_path / "new")["total_players"] == 4
+
+
+def test_write_dataset_rejects_empty_chunks(tmp_path):
+    with pytest.raises(ValueError, match="chunk_size"):
+        write_dataset(tmp_path, [], chunk_size=0)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dataset_paths_orders_chunks_numerically(tmp_path):
+    names = ["players-100000.jsonl", "extra.jsonl", "players-99999.jsonl",
+             "players-00002.jsonl"]
+    for name in names:
+        (tmp_path / name).write_text("")
+    paths = [os.path.basename(p) for p in dataset_paths(str(tmp_path))]
+    assert paths == ["players-00002.jsonl", "players-99999.jsonl",
+                     "players-100000.jsonl", "extra.jsonl"]
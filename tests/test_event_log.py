@@ -0,0 +1,100 @@
+"""Tests for the binary event log in ex5/ft_event_log.py."""
+
+import gc
+import random
+import sys
+
+import pytest
+
+from ex5.ft_data_stream import game_event_generator, stream_analytics
+from ex5.ft_event_log import (
+    RECORD,
+    read_event_columns,
+    replay_counts,
+    replay_events,
+    write_events,
+)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "events.bin"
+
+
+def test_round_trip_matches_seeded_stream(log_path):
+    random.seed(5)
+    events = list(game_event_generator(500))
+    assert write_events(log_path, iter(events), batch_size=64) == 500
+    assert log_path.stat().st_size == 500 * RECORD.size
+    assert list(replay_events(log_path)) == events
+
+
+def test_write_events_appends_batches(log_path):
+    random.seed(5)
+    events = list(game_event_generator(10))
+    write_events(log_path, events[:4])
+    write_events(log_path, events[4:])
+    assert list(replay_events(log_path)) == events
+
+
+def test_replay_counts_match_stream_analytics(log_path):
+    random.seed(42)
+    write_events(log_path, game_event_generator(1000))
+    counts = replay_counts(log_path)
+    high_level, treasure, level_up = stream_analytics(1000)
+    assert counts == {
+        "total": 1000,
+        "high_level": high_level,
+        "treasure": treasure,
+        "level_up": level_up,
+    }
+
+
+def test_small_chunks_match_single_chunk(log_path):
+    random.seed(9)
+    write_events(log_path, game_event_generator(100))
+    levels = b"".join(
+        lv.tobytes() for _, lv, _, _ in read_event_columns(log_path, 7)
+    )
+    assert levels == bytes(e["level"] for e in replay_events(log_path))
+
+
+def test_trailing_partial_record_is_ignored(log_path):
+    random.seed(5)
+    events = list(game_event_generator(20))
+    write_events(log_path, events)
+    with open(log_path, "ab") as file:
+        file.write(b"\x01\x02\x03")
+    assert list(replay_events(log_path)) == events
+    assert replay_counts(log_path)["total"] == 20
+
+
+def test_empty_file(log_path):
+    log_path.write_bytes(b"")
+    assert list(replay_events(log_path)) == []
+    assert replay_counts(log_path)["total"] == 0
+
+
+def test_kept_slice_raises_at_end_of_log(log_path):
+    random.seed(5)
+    write_events(log_path, game_event_generator(20))
+    kept = []
+    with pytest.raises(BufferError, match="still referenced"):
+        for _, levels, _, _ in read_event_columns(log_path):
+            kept.append(levels[0:10])
+    del kept
+
+
+def test_consumer_error_is_not_masked(log_path, monkeypatch):
+    random.seed(5)
+    write_events(log_path, game_event_generator(20))
+    unraisable = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+    kept = []
+    with pytest.raises(KeyError):
+        for _, levels, _, _ in read_event_columns(log_path):
+            kept.append(levels[0:10])
+            raise KeyError("consumer failure")
+    gc.collect()
+    assert unraisable == []
+    del kept
@@ -0,0 +1,82 @@
+"""Tests for the mergeable sketches in ex5/ft_stream_sketches.py."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from ex5.ft_stream_sketches import CountMinSketch, HyperLogLog, SpaceSaving
+
+
+def skewed_items(count, seed):
+    """Draw items with a few heavy hitters and a long tail."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        if rng.random() < 0.4:
+            yield f"heavy_{rng.randrange(5)}"
+        else:
+            yield f"tail_{rng.randrange(5000)}"
+
+
+@pytest.mark.parametrize("error", [0.05, 0.01])
+def test_merged_hyperloglog_within_error(error):
+    first = HyperLogLog(error)
+    second = HyperLogLog(error)
+    for i in range(30000):
+        first.add(f"player_{i}")
+    for i in range(20000, 60000):
+        second.add(f"player_{i}")
+    first.merge(second)
+    # Three standard errors
+    assert abs(first.count() - 60000) <= 3 * error * 60000
+
+
+def test_hyperloglog_rejects_unsupported_error():
+    assert HyperLogLog(0.00204).precision == 18
+    with pytest.raises(ValueError, match="smallest supported error"):
+        HyperLogLog(0.002)
+    with pytest.raises(ValueError):
+        HyperLogLog(0)
+
+
+def test_merged_count_min_never_underestimates():
+    first_items = list(skewed_items(20000, seed=1))
+    second_items = list(skewed_items(20000, seed=2))
+    first = CountMinSketch(epsilon=0.01, delta=0.01)
+    second = CountMinSketch(epsilon=0.01, delta=0.01)
+    for item in first_items:
+        first.add(item)
+    for item in second_items:
+        second.add(item)
+    first.merge(second)
+    exact = Counter(first_items + second_items)
+    assert first.total == 40000
+    for item, count in exact.items():
+        assert first.estimate(item) >= count
+    for i in range(5):
+        assert first.estimate(f"heavy_{i}") <= exact[f"heavy_{i}"] + 400
+
+
+def test_merged_space_saving_keeps_heavy_hitters():
+    first_items = list(skewed_items(20000, seed=1))
+    second_items = list(skewed_items(20000, seed=2))
+    first = SpaceSaving(capacity=50)
+    second = SpaceSaving(capacity=50)
+    for item in first_items:
+        first.add(item)
+    for item in second_items:
+        second.add(item)
+    first.merge(second)
+    exact = Counter(first_items + second_items)
+    threshold = first.total / first.capacity
+    heavy = {item for item, count in exact.items() if count > threshold}
+    assert heavy
+    assert heavy <= first.counts.keys()
+    for item, count, error in first.top():
+        assert count - error <= exact[item] <= count
+
+
+def test_space_saving_rejects_empty_capacity():
+    with pytest.raises(ValueError, match="capacity"):
+        SpaceSaving(capacity=0)
+    assert SpaceSaving(capacity=1).capacity == 1
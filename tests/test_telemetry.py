@@ -0,0 +1,49 @@
+"""Tests for the hot-path instrumentation in ft_telemetry.py."""
+
+import pytest
+
+import ft_telemetry
+from ex5.ft_data_stream import count_action_events, game_event_generator
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    ft_telemetry.reset()
+    yield
+    ft_telemetry.reset()
+
+
+def test_consumed_counts_stream_events():
+    counted = ft_telemetry.wrap(count_action_events, "test.count",
+                                ft_telemetry.CONSUMED)
+    assert counted(game_event_generator(250), "leveled up") >= 0
+    counted(iter([]), "leveled up")
+    metric = ft_telemetry.snapshot()["test.count"]
+    assert metric["calls"] == 2
+    assert metric["items"] == 250
+
+
+def test_raising_call_is_recorded():
+    def fail(values):
+        raise ValueError("bad input")
+
+    wrapped = ft_telemetry.wrap(fail, "test.fail",
+                                lambda args, result: len(args[0]))
+    with pytest.raises(ValueError):
+        wrapped([1, 2, 3])
+    metric = ft_telemetry.snapshot()["test.fail"]
+    assert metric["calls"] == 1
+    assert metric["items"] == 0
+    assert sum(metric["buckets"].values()) == 1
+
+
+def test_prometheus_bucket_bounds_are_exact():
+    ft_telemetry.wrap(len, "test.len")([1])
+    text = ft_telemetry.to_prometheus()
+    bounds = [line.split('le="')[1].split('"')[0]
+              for line in text.splitlines() if 'le="' in line]
+    assert bounds[-1] == "+Inf"
+    assert [float(b) * 1e9 for b in bounds[:-1]] == [
+        float(b) for b in ft_telemetry.BUCKETS_NS
+    ]
+    assert "67.108864" in bounds